@@ -12,8 +12,13 @@ Version: 1.0.3
 import tkinter as tk
 from tkinter import filedialog, scrolledtext, messagebox
 import re
-from collections import defaultdict
+import sys
+from collections import Counter
+from itertools import takewhile
+import mmap
 import os
+import time
+import urllib.error
 import urllib.request
 import json
 import webbrowser
@@ -21,184 +26,356 @@ import threading
 
 # Configuration
 APP_VERSION = "1.0.4"
+_CURRENT_VER = tuple(map(int, APP_VERSION.split('.')))
 
-# Patterns to detect greedy bashes and extract pirate names
-BASH_PATTERNS = [
-    r"\[.*?\]\s*(?P<pirate>.+?) performs a powerful attack against .+ and steals some loot in the process!",
-    r"\[.*?\]\s*(?P<pirate>.+?) delivers an overwhelming barrage against .+ causing some treasure to fall from their grip!",
-    r"\[.*?\]\s*(?P<pirate>.+?) executes a masterful strike against .+ who drops some treasure in surprise!",
-    r"\[.*?\]\s*(?P<pirate>.+?) swings a devious blow against .+ jarring some treasure loose!"
-]
+# Update check settings; the cache file remembers the last check between runs
+UPDATE_URL = "https://api.github.com/repos/SwiggityYPP/bash-and-dash/releases/latest"
+UPDATE_CACHE_PATH = os.path.join(os.environ.get('APPDATA') or os.path.expanduser('~'),
+                                 'bash-and-dash', 'update.json')
+UPDATE_CHECK_INTERVAL = 24 * 3600
 
-# Battle detection patterns
-START_PATTERN = r'Game over'
-END_PATTERN = r'Game over'
+# Quiet period before a payout edit re-renders the payout list
+PAYOUT_DEBOUNCE_MS = 150
 
-def count_greedy_bashes_per_battle(file_path):
+# Pattern to detect greedy bashes and extract pirate names. Compiled once as a
+# bytes pattern so the log can be scanned without decoding it. The timestamp
+# is a negated character class rather than a lazy .*? so it cannot backtrack,
+# and neither it nor the whitespace after it can cross a newline. Bytes \S is
+# ASCII-only, so decoded names are still stripped of Unicode whitespace.
+BASH_PATTERN = (
+    rb"\[[^\]\n]*\][^\S\n]*(?P<pirate>\S(?:.*?\S)?)[^\S\n]* (?:"
+    rb"performs a powerful attack against .+ and steals some loot in the process!"
+    rb"|delivers an overwhelming barrage against .+ causing some treasure to fall from their grip!"
+    rb"|executes a masterful strike against .+ who drops some treasure in surprise!"
+    rb"|swings a devious blow against .+ jarring some treasure loose!"
+    rb")"
+)
+
+BASH_RE = re.compile(BASH_PATTERN)
+
+# Cheap prefilter: every bash line says "some loot" or "some treasure", while
+# most chat lines do not, so the full pattern only runs on candidate lines.
+# The shared literal prefix lets the regex engine skip ahead with a fast
+# substring search instead of trying an alternation at every position.
+BASH_ANCHOR_RE = re.compile(rb"some (?:loot|treasure)")
+
+# Battle detection marker, matched as a plain substring
+BATTLE_MARKER = b'Game over'
+
+# Read size used when a log cannot be memory-mapped
+READ_CHUNK_SIZE = 1 << 20
+
+# Last parse per log path as {path: ((st_mtime_ns, st_size), last_battle)}
+_parse_cache = {}
+
+def read_log_buffer(f):
+    """
+    Returns the contents of a log file opened in binary mode as one buffer.
+    
+    The file is memory-mapped when possible. Empty files and files that cannot
+    be mapped are read in large chunks instead, never line by line.
+    
+    Args:
+        f (file): Log file opened with mode 'rb'
+        
+    Returns:
+        mmap.mmap or bytes: Log contents; an mmap must be closed by the caller
+    """
+    try:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        chunks = []
+        while True:
+            chunk = f.read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b''.join(chunks)
+
+def find_bashes(buf, start, end):
     """
-    Analyzes game log file to count greedy bash attacks per battle session.
+    Yields greedy bash matches in buf[start:end], at most one per line.
+    
+    Args:
+        buf (bytes or mmap.mmap): Log contents
+        start (int): Offset to start scanning at
+        end (int): Offset to stop scanning at
+        
+    Yields:
+        Match objects from BASH_RE with a 'pirate' group
+    """
+    line_end = start
+    for anchor in BASH_ANCHOR_RE.finditer(buf, start, end):
+        # Skip further anchors on a line that was already checked
+        if anchor.start() < line_end:
+            continue
+        line_start = buf.rfind(b'\n', start, anchor.start()) + 1
+        line_start = max(line_start, start)
+        line_end = buf.find(b'\n', anchor.end(), end)
+        if line_end == -1:
+            line_end = end
+        match = BASH_RE.search(buf, line_start, line_end)
+        if match:
+            yield match
+
+def count_battle(buf, start, end):
+    """
+    Counts greedy bashes per pirate in one battle.
+    
+    Args:
+        buf (bytes or mmap.mmap): Log contents
+        start (int): Offset of the battle's first line
+        end (int): Offset just past the battle's last line
+        
+    Returns:
+        Counter: Bash counts keyed by pirate name
+    """
+    # Count raw names in C, then decode each distinct name once; interning
+    # lets every parse share one string object per pirate
+    raw_counts = Counter(m.group('pirate') for m in find_bashes(buf, start, end))
+    battle = Counter()
+    for raw_name, count in raw_counts.items():
+        battle[sys.intern(raw_name.decode('utf-8', 'ignore').strip())] += count
+    return battle
+
+def count_last_battle(file_path):
+    """
+    Counts greedy bash attacks in the most recent battle of a game log.
+    
+    A battle runs from the line after a "Game over" marker up to the start
+    of the line holding the next marker, or the end of the log. The log is
+    searched backwards from the end for markers, so only the last battle
+    (plus any trailing battles without bashes) is scanned.
     
     Args:
         file_path (str): Path to the game log file
         
     Returns:
-        list: List of dictionaries containing bash counts per pirate per battle
+        Counter: Bash counts for the last battle with any bashes, or an
+            empty Counter if there is none
+        
+    Raises:
+        OSError: If the log cannot be read. Errors are not cached by
+            get_last_battle, so a later Update retries the read.
     """
-    battles = []
-    in_battle = False
-    current_battle = defaultdict(int)
+    last_battle = Counter()
+    
+    with open(file_path, 'rb') as f:
+        buf = read_log_buffer(f)
     
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                # Check for battle start marker
-                if re.search(START_PATTERN, line):
-                    # If we were already in a battle, save it before starting a new one
-                    if in_battle and current_battle:
-                        battles.append(dict(current_battle))
-                    
-                    # Initialize new battle tracking
-                    in_battle = True
-                    current_battle = defaultdict(int)
-                    continue
-                
-                # Process lines during battle
-                if in_battle:
-                    # Check each bash pattern against the current line
-                    for pattern in BASH_PATTERNS:
-                        match = re.search(pattern, line)
-                        if match:
-                            pirate = match.group('pirate').strip()
-                            current_battle[pirate] += 1
-                            break
-        
-        # Add the last battle if we were still in one
-        if in_battle and current_battle:
-            battles.append(dict(current_battle))
+        end = len(buf)
+        marker = buf.rfind(BATTLE_MARKER)
+        while marker != -1:
+            line_end = buf.find(b'\n', marker)
+            start = len(buf) if line_end == -1 else line_end + 1
+            battle = count_battle(buf, start, end)
+            if battle:
+                last_battle = battle
+                break
             
-    except Exception as e:
-        print(f"Error reading file: {e}")
-        return []
+            # Empty battle: step back to the one before it
+            end = buf.rfind(b'\n', 0, marker) + 1
+            marker = buf.rfind(BATTLE_MARKER, 0, marker)
+    finally:
+        if isinstance(buf, mmap.mmap):
+            try:
+                buf.close()
+            except BufferError:
+                # A failed scan can still hold matches into the map; it is
+                # released once they are gone, so keep the original error
+                pass
+    
+    return last_battle
+
+def log_stat_key(file_path):
+    """Returns (st_mtime_ns, st_size) for a log, which changes whenever it is written."""
+    st = os.stat(file_path)
+    return st.st_mtime_ns, st.st_size
+
+def get_last_battle(file_path):
+    """
+    Returns the last battle of a log, reusing the last parse while it is unchanged.
     
-    return battles
+    Args:
+        file_path (str): Path to the game log file
+        
+    Returns:
+        Counter: Same as count_last_battle
+    """
+    key = log_stat_key(file_path)
+    cached = _parse_cache.get(file_path)
+    if cached and cached[0] == key:
+        return cached[1]
+    last_battle = count_last_battle(file_path)
+    _parse_cache[file_path] = (key, last_battle)
+    return last_battle
+
+# Row styles for the payout commands list
+PAYOUT_ROW_STYLES = {
+    'top': {
+        'prefix': "🏆",
+        'pady': 3,
+        'label': {'fg': "#00d4aa", 'font': ("Consolas", 11, "bold"), 'pady': 6},
+        'button_font': ("Segoe UI", 10, "bold"),
+    },
+    'bash': {
+        'prefix': "⚔️",
+        'pady': 2,
+        'label': {'fg': "#dcddde", 'font': ("Consolas", 10), 'pady': 4},
+        'button_font': ("Segoe UI", 9, "bold"),
+    },
+}
 
-def show_summary_in_gui(battles, text_widget, payout_frame, payout_var, top_var, total_label, root):
-    """Update the GUI with battle analysis results."""
+def show_summary_in_gui(last_battle, text_widget, payout_frame, payout_var, top_var, total_label, payout_rows):
+    """
+    Update the GUI with battle analysis results.
+    
+    Returns:
+        list: (pirate, count) pairs sorted by bash count, for apply_payouts
+    """
+    # Pirates sorted by bash count (descending), shared by every section below
+    ranked = last_battle.most_common() if last_battle else []
+    
     # Clear existing content
     text_widget.config(state=tk.NORMAL)
     text_widget.delete(1.0, tk.END)
     
-    # Clear existing payout widgets
-    for widget in payout_frame.winfo_children():
-        widget.destroy()
-    
-    # Helper function to bind mousewheel to new widgets
-    def bind_mousewheel_to_new_widget(widget):
-        def on_mousewheel(event):
-            # Find the canvas by traversing up the widget hierarchy
-            canvas = widget
-            while canvas and not isinstance(canvas, tk.Canvas):
-                canvas = canvas.master
-            if canvas and hasattr(canvas, 'yview_scroll'):
-                canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        widget.bind("<MouseWheel>", on_mousewheel)
-        for child in widget.winfo_children():
-            bind_mousewheel_to_new_widget(child)
-    
-    if not battles:
+    if not ranked:
         summary = "No greedy bashes found."
-        total_label.config(text="Total Battle Payout: 0 PoE")
     else:
-        # Process the most recent battle
-        last_battle = battles[-1]
+        # Create pirate summary for the most recent battle
         total_bashes = sum(last_battle.values())
+        pirate_parts = ", ".join(f"{pirate} ({count})" for pirate, count in ranked)
+        summary = f"Total greedy bashes: {total_bashes}, {pirate_parts}"
+    
+    apply_payouts(ranked, payout_frame, payout_var, top_var, total_label, payout_rows)
+    
+    # Update summary text widget
+    text_widget.insert(tk.END, summary + "\n")
+    text_widget.config(state=tk.DISABLED)
+    
+    return ranked
+
+def read_payouts(payout_var, top_var):
+    """Returns (payout per bash, top basher payout), both 0 if either is not a number."""
+    try:
+        return int(payout_var.get()), int(top_var.get())
+    except (ValueError, TypeError):
+        return 0, 0
+
+def apply_payouts(ranked, payout_frame, payout_var, top_var, total_label, payout_rows):
+    """
+    Update the payout commands and total for the current payout values.
+    
+    Only depends on the ranked pirates, so payout edits can skip re-sorting
+    the battle and rewriting the summary.
+    
+    Args:
+        ranked (list): (pirate, count) pairs sorted by bash count (descending)
+        payout_frame (tk.Frame): Container for the payout rows
+        payout_var (tk.StringVar): Payout per bash
+        top_var (tk.StringVar): Top basher payout
+        total_label (tk.Label): Label showing the total battle payout
+        payout_rows (list): Pool of row dicts, see update_payout_rows
+    """
+    # Payout rows to display as (style, command) pairs
+    entries = []
+    
+    payout, top_payout = read_payouts(payout_var, top_var)
+    
+    total_battle_payout = 0
+    
+    # Top basher payout
+    if ranked and top_payout > 0:
+        max_bashes = ranked[0][1]
+        # Counts are sorted, so the top bashers are the leading run of max_bashes
+        top_bashers = [pirate for pirate, count in
+                       takewhile(lambda item: item[1] == max_bashes, ranked)]
         
-        # Create pirate summary sorted by bash count (descending)
-        pirate_parts = [f"{pirate} ({count})" for pirate, count in 
-                       sorted(last_battle.items(), key=lambda x: -x[1])]
-        
-        summary = f"Total greedy bashes: {total_bashes}"
-        if pirate_parts:
-            summary += ", " + ", ".join(pirate_parts)
-        
-        # Handle payouts
-        try:
-            payout = int(payout_var.get())
-            top_payout = int(top_var.get())
-        except (ValueError, TypeError):
-            payout = 0
-            top_payout = 0
-        
-        total_battle_payout = 0
+        for pirate in top_bashers:
+            total_battle_payout += top_payout  # Add top basher payout to total
+            entries.append(('top', f"/pay {pirate} {top_payout}"))
+    
+    # Per-bash payouts
+    if payout > 0 and ranked:
+        for pirate, count in ranked:
+            total_pay = payout * count
+            total_battle_payout += total_pay
+            entries.append(('bash', f"/pay {pirate} {total_pay}"))
+    
+    total_label.config(text=f"Total Battle Payout: {total_battle_payout:,} PoE")
+    update_payout_rows(payout_frame, payout_rows, entries)
+
+def update_payout_rows(payout_frame, payout_rows, entries):
+    """
+    Show payout commands using a pool of reusable row widgets.
+    
+    Existing rows are reconfigured in place, new rows are only created when
+    the pool is too small, and surplus rows are hidden rather than destroyed.
+    
+    Args:
+        payout_frame (tk.Frame): Container for the payout rows
+        payout_rows (list): Pool of row dicts, extended in place; 'style' is
+            the style the row is shown with, or None while it is hidden
+        entries (list): (style, pay command) pairs to display, in order
+    """
+    for i, (style_name, pay_cmd) in enumerate(entries):
+        style = PAYOUT_ROW_STYLES[style_name]
         
-        # Top basher payout
-        if last_battle and top_payout > 0:
-            sorted_bashers = sorted(last_battle.items(), key=lambda x: -x[1])
-            max_bashes = sorted_bashers[0][1] if sorted_bashers else 0
-            top_bashers = [pirate for pirate, count in sorted_bashers if count == max_bashes]
+        if i < len(payout_rows):
+            slot = payout_rows[i]
+        else:
+            row = tk.Frame(payout_frame, bg="#2f3136")
+            label = tk.Label(row, bg="#2f3136", padx=8, anchor="w")
+            label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            button = tk.Button(row, text="📋", width=3,
+                               bg="#5865f2", fg="#ffffff",
+                               relief=tk.FLAT, bd=0, cursor="hand2")
+            button.pack(side=tk.RIGHT, padx=8)
             
-            for pirate in top_bashers:
-                pay_cmd = f"/pay {pirate} {top_payout}"
-                total_battle_payout += top_payout  # Add top basher payout to total
-                
-                row = tk.Frame(payout_frame, bg="#2f3136")
-                row.pack(anchor="w", pady=3, padx=12, fill=tk.X)
-                
-                pay_label = tk.Label(row, text=f"🏆 {pay_cmd}", 
-                                   bg="#2f3136", fg="#00d4aa", 
-                                   font=("Consolas", 11, "bold"), 
-                                   padx=8, pady=6, anchor="w")
-                pay_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
-                
-                copy_btn = tk.Button(row, text="📋", width=3,
-                                   command=lambda cmd=pay_cmd, lbl=pay_label: copy_and_strikethrough(cmd, lbl, root),
-                                   bg="#5865f2", fg="#ffffff",
-                                   font=("Segoe UI", 10, "bold"),
-                                   relief=tk.FLAT, bd=0, cursor="hand2")
-                copy_btn.pack(side=tk.RIGHT, padx=8)
-                
-                # Bind mouse wheel to the new row and its children
-                bind_mousewheel_to_new_widget(row)
+            slot = {'row': row, 'label': label, 'button': button, 'style': None, 'cmd': None}
+            # Every Copy button shares one handler that finds its row via the
+            # button, so reusing the row never creates another callback
+            button.slot = slot
+            for sequence in ('<ButtonRelease-1>', '<space>', '<Return>'):
+                button.bind(sequence, _on_copy)
+            payout_rows.append(slot)
         
-        # Per-bash payouts
-        if payout > 0 and last_battle:
-            for pirate, count in sorted(last_battle.items(), key=lambda x: -x[1]):
-                total_pay = payout * count
-                total_battle_payout += total_pay
-                pay_cmd = f"/pay {pirate} {total_pay}"
-                
-                row = tk.Frame(payout_frame, bg="#2f3136")
-                row.pack(anchor="w", pady=2, padx=12, fill=tk.X)
-                
-                pay_label = tk.Label(row, text=f"⚔️ {pay_cmd}", 
-                                   bg="#2f3136", fg="#dcddde",
-                                   font=("Consolas", 10), 
-                                   padx=8, pady=4, anchor="w")
-                pay_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
-                
-                copy_btn = tk.Button(row, text="📋", width=3,
-                                   command=lambda cmd=pay_cmd, lbl=pay_label: copy_and_strikethrough(cmd, lbl, root),
-                                   bg="#5865f2", fg="#ffffff",
-                                   font=("Segoe UI", 9, "bold"),
-                                   relief=tk.FLAT, bd=0, cursor="hand2")
-                copy_btn.pack(side=tk.RIGHT, padx=8)
-                
-                # Bind mouse wheel to the new row and its children
-                bind_mousewheel_to_new_widget(row)
+        slot['cmd'] = pay_cmd
+        # Reset the label style too, since copying strikes it through
+        slot['label'].config(text=f"{style['prefix']} {pay_cmd}", **style['label'])
         
-        total_label.config(text=f"Total Battle Payout: {total_battle_payout:,} PoE")
-    
-    # Update summary text widget
-    text_widget.insert(tk.END, summary + "\n")
-    text_widget.config(state=tk.DISABLED)
+        # Only touch the geometry manager when a row is shown or restyled;
+        # hidden rows always trail the visible ones, so packing keeps order
+        if slot['style'] != style_name:
+            slot['button'].config(font=style['button_font'])
+            slot['row'].pack(anchor="w", pady=style['pady'], padx=12, fill=tk.X)
+            slot['style'] = style_name
+    
+    # Hide rows that are not needed for this render
+    for slot in payout_rows[len(entries):]:
+        if slot['style'] is not None:
+            slot['row'].pack_forget()
+            slot['style'] = None
+
+def _on_copy(event):
+    """Shared click handler for the Copy button of every pooled payout row."""
+    button = event.widget
+    # Like a button command, a click only counts if released over the button;
+    # Space and Return on a focused button always copy
+    if event.type == tk.EventType.ButtonRelease and \
+            button.winfo_containing(event.x_root, event.y_root) is not button:
+        return
+    slot = button.slot
+    copy_and_strikethrough(slot['cmd'], slot['label'], button.winfo_toplevel())
 
 def copy_to_clipboard(text, root):
     """Copy text to clipboard."""
     try:
         root.clipboard_clear()
         root.clipboard_append(text)
-        root.update()
+        root.update_idletasks()
     except:
         pass
 
@@ -207,7 +384,7 @@ def copy_and_strikethrough(text, label, root):
     try:
         root.clipboard_clear()
         root.clipboard_append(text)
-        root.update()
+        root.update_idletasks()
         
         # Add strikethrough by changing font and color
         current_font = label.cget("font")
@@ -230,18 +407,71 @@ def copy_and_strikethrough(text, label, root):
     except:
         pass
 
+def is_newer_version(latest_version):
+    """Return True if latest_version (e.g. "1.0.5") is newer than APP_VERSION."""
+    try:
+        return tuple(map(int, latest_version.split('.'))) > _CURRENT_VER
+    except ValueError:
+        return False
+
+def load_update_cache():
+    """Load the cached result of the last update check, or {} if there is none."""
+    try:
+        with open(UPDATE_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if isinstance(cache, dict):
+            return cache
+    except (OSError, ValueError):
+        pass
+    return {}
+
+def save_update_cache(cache):
+    """Persist the result of an update check; failures are not fatal."""
+    try:
+        os.makedirs(os.path.dirname(UPDATE_CACHE_PATH), exist_ok=True)
+        with open(UPDATE_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
 def check_for_updates():
-    """Check for updates from GitHub releases."""
+    """
+    Check for updates from GitHub releases.
+    
+    The latest release is cached on disk together with its ETag. Within
+    UPDATE_CHECK_INTERVAL of the last check no request is made at all, and
+    after that a conditional request lets GitHub answer 304 Not Modified.
+    
+    Returns:
+        tuple: (latest_version, download_url) if newer, else (None, None)
+    """
     try:
-        url = "https://api.github.com/repos/SwiggityYPP/bash-and-dash/releases/latest"
-        with urllib.request.urlopen(url, timeout=5) as response:
-            data = json.loads(response.read().decode())
-            latest_version = data['tag_name'].lstrip('v')
-            download_url = data['html_url']
+        cache = load_update_cache()
+        latest_version = cache.get('latest')
+        download_url = cache.get('url')
+        
+        if not latest_version or time.time() - cache.get('checked_at', 0) >= UPDATE_CHECK_INTERVAL:
+            headers = {}
+            if latest_version and cache.get('etag'):
+                headers['If-None-Match'] = cache['etag']
+            request = urllib.request.Request(UPDATE_URL, headers=headers)
+            try:
+                with urllib.request.urlopen(request, timeout=3) as response:
+                    data = json.loads(response.read().decode())
+                    latest_version = data['tag_name'].lstrip('v')
+                    download_url = data['html_url']
+                    cache['etag'] = response.headers.get('ETag')
+            except urllib.error.HTTPError as e:
+                # 304 means the cached release is still the latest one
+                if e.code != 304:
+                    raise
             
-            # Compare versions
-            if latest_version != APP_VERSION:
-                return latest_version, download_url
+            cache.update(latest=latest_version, url=download_url, checked_at=time.time())
+            save_update_cache(cache)
+        
+        # Compare versions
+        if is_newer_version(latest_version):
+            return latest_version, download_url
     except:
         pass
     return None, None
@@ -285,7 +515,14 @@ def main_gui():
     root.resizable(True, True)
     
     # Application state
-    state = {'file_path': None}
+    state = {'file_path': None, 'ranked': None, 'pending_after': None, 'payout_rows': [],
+             'last_stat': None, 'payout_key': None}
+    
+    def render_summary(last_battle):
+        """Render an already-parsed battle into the summary and payout widgets."""
+        state['ranked'] = show_summary_in_gui(last_battle, result_box, payout_frame, payout_var, top_var,
+                                              total_label, state['payout_rows'])
+        state['payout_key'] = read_payouts(payout_var, top_var)
     
     def select_file():
         """Handle file selection and analysis."""
@@ -301,22 +538,47 @@ def main_gui():
         )
         
         if file_path:
-            try:
-                state['file_path'] = file_path
-                battles = count_greedy_bashes_per_battle(file_path)
-                show_summary_in_gui(battles, result_box, payout_frame, payout_var, top_var, total_label, root)
-            except Exception as e:
-                messagebox.showerror("Error", f"Error reading file: {str(e)}")
+            state['file_path'] = file_path
+            start_analysis(file_path)
     
     def update_file():
         """Re-analyze the currently selected file."""
         file_path = state.get('file_path')
         if file_path:
+            # Nothing to do if the log has not changed since it was shown;
+            # this also keeps the strikethrough on rows already copied
             try:
-                battles = count_greedy_bashes_per_battle(file_path)
-                show_summary_in_gui(battles, result_box, payout_frame, payout_var, top_var, total_label, root)
-            except Exception as e:
-                messagebox.showerror("Error", f"Error reading file: {str(e)}")
+                if (file_path, log_stat_key(file_path)) == state.get('last_stat'):
+                    return
+            except OSError:
+                pass
+            start_analysis(file_path)
+    
+    def start_analysis(file_path):
+        """Parse the log in a worker thread so the GUI stays responsive."""
+        thread = threading.Thread(target=parse_worker, args=(file_path,), daemon=True)
+        thread.start()
+    
+    def parse_worker(file_path):
+        """Run the log parse off the Tk thread and hand the result back to it."""
+        try:
+            stat_key = log_stat_key(file_path)
+            last_battle = get_last_battle(file_path)
+        except Exception as e:
+            error = f"Error reading file: {str(e)}"
+            root.after(0, lambda: messagebox.showerror("Error", error))
+            return
+        root.after(0, lambda: finish_analysis(file_path, stat_key, last_battle))
+    
+    def finish_analysis(file_path, stat_key, last_battle):
+        """Store and render parse results on the Tk thread."""
+        # Ignore results for a file that is no longer selected
+        if file_path != state.get('file_path'):
+            return
+        state['last_stat'] = (file_path, stat_key)
+        # This render already uses the current payout values
+        cancel_pending_update()
+        render_summary(last_battle)
     
     def copy_summary():
         """Copy the summary text to clipboard."""
@@ -327,15 +589,36 @@ def main_gui():
             pass
     
     def payout_update(*args):
-        """Triggered when payout values change."""
-        file_path = state.get('file_path')
-        if file_path:
+        """Triggered when payout values change; debounced so rapid typing renders once."""
+        cancel_pending_update()
+        state['pending_after'] = root.after(PAYOUT_DEBOUNCE_MS, apply_payout_update)
+    
+    def cancel_pending_update():
+        """Drop a debounced payout render that has not run yet."""
+        if state.get('pending_after'):
+            root.after_cancel(state['pending_after'])
+            state['pending_after'] = None
+    
+    def apply_payout_update():
+        """Update only the payout rows and total for the current payout values."""
+        state['pending_after'] = None
+        ranked = state.get('ranked')
+        if ranked is not None:
+            # Retyping the same value needs no update
+            payout_key = read_payouts(payout_var, top_var)
+            if payout_key == state.get('payout_key'):
+                return
+            state['payout_key'] = payout_key
             try:
-                battles = count_greedy_bashes_per_battle(file_path)
-                show_summary_in_gui(battles, result_box, payout_frame, payout_var, top_var, total_label, root)
+                apply_payouts(ranked, payout_frame, payout_var, top_var, total_label,
+                              state['payout_rows'])
             except:
                 pass
     
+    def is_digits_or_empty(value):
+        """Validate payout entry edits so only digits can be typed."""
+        return value == "" or value.isdigit()
+    
     # Main buttons
     button_frame = tk.Frame(root, bg="#1e2124")
     button_frame.pack(pady=15)
@@ -394,6 +677,9 @@ def main_gui():
     inputs_frame = tk.Frame(input_container, bg="#1e2124")
     inputs_frame.pack(fill=tk.X)
     
+    # Payout fields only accept whole numbers
+    digits_vcmd = (root.register(is_digits_or_empty), '%P')
+    
     # Top basher input
     top_input_frame = tk.Frame(inputs_frame, bg="#1e2124")
     top_input_frame.pack(side=tk.LEFT, padx=(0, 20))
@@ -406,7 +692,8 @@ def main_gui():
     top_entry = tk.Entry(top_input_frame, textvariable=top_var, 
                         font=("Segoe UI", 11), width=10, bg="#40444b", 
                         fg="#ffffff", relief=tk.FLAT, bd=0,
-                        insertbackground="#ffffff", selectbackground="#5865f2")
+                        insertbackground="#ffffff", selectbackground="#5865f2",
+                        validate='key', validatecommand=digits_vcmd)
     top_entry.pack(pady=(5, 0))
     
     # Per bash input
@@ -421,7 +708,8 @@ def main_gui():
     payout_entry = tk.Entry(payout_input_frame, textvariable=payout_var, width=10, 
                            bg="#40444b", fg="#ffffff", relief=tk.FLAT, bd=0,
                            insertbackground="#ffffff", selectbackground="#5865f2",
-                           font=("Segoe UI", 11))
+                           font=("Segoe UI", 11),
+                           validate='key', validatecommand=digits_vcmd)
     payout_entry.pack(pady=(5, 0))
     
     # Scrollable payout commands area
@@ -452,33 +740,22 @@ def main_gui():
     def on_mousewheel(event):
         canvas.yview_scroll(int(-1*(event.delta/120)), "units")
     
-    def bind_mousewheel_to_widget(widget):
-        """Recursively bind mouse wheel to widget and all its children."""
-        widget.bind("<MouseWheel>", on_mousewheel)
-        for child in widget.winfo_children():
-            bind_mousewheel_to_widget(child)
-    
     def bind_mousewheel(event):
-        canvas.bind("<MouseWheel>", on_mousewheel)
-        bind_mousewheel_to_widget(payout_frame)
-    
-    def unbind_mousewheel_from_widget(widget):
-        """Recursively unbind mouse wheel from widget and all its children."""
-        widget.unbind("<MouseWheel>")
-        for child in widget.winfo_children():
-            unbind_mousewheel_from_widget(child)
+        # A single application-wide binding covers the canvas and every
+        # payout row, but only while the pointer is over the canvas
+        canvas.bind_all("<MouseWheel>", on_mousewheel)
     
     def unbind_mousewheel(event):
-        canvas.unbind("<MouseWheel>")
-        unbind_mousewheel_from_widget(payout_frame)
+        # Moving onto a payout row also counts as leaving the canvas
+        widget = canvas.winfo_containing(event.x_root, event.y_root)
+        if widget is not None and (widget == canvas or str(widget).startswith(str(canvas) + '.')):
+            return
+        canvas.unbind_all("<MouseWheel>")
     
     payout_frame.bind("<Configure>", on_frame_configure)
     canvas.bind('<Enter>', bind_mousewheel)
     canvas.bind('<Leave>', unbind_mousewheel)
     
-    # Also bind to the payout_frame and its children initially
-    bind_mousewheel_to_widget(payout_frame)
-    
     canvas.pack(side="left", fill="both", expand=True)
     scrollbar.pack(side="right", fill="y")
     
@@ -508,7 +785,7 @@ def main_gui():
                             bg="#1e2124", fg="#72767d")
     version_label.pack(side=tk.RIGHT, padx=(0, 25))
     
-    # Auto-update handlers
+    # Auto-update handlers; payout_update debounces so typing renders once
     payout_var.trace_add('write', payout_update)
     top_var.trace_add('write', payout_update)
     